@@ -3,11 +3,22 @@
 from __future__ import annotations
 
 import datetime as _dt
+import io
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Sequence
 
 import requests
 
+from HttpSession import conditional_get, loads_json, make_session
+
+try:  # pragma: no cover - optional dependency
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
 BASE_URL = "https://api.nasdaq.com/api/calendar/earnings"
 HEADERS = {
     "User-Agent": (
@@ -18,9 +29,46 @@ HEADERS = {
 }
 
 DATE_FORMAT = "%Y-%m-%d"
+MAX_WORKERS = 8
+
+_TABLE_HEADER = (
+    "| Symbol | Company | Time | EPS Estimate | EPS Actual |\n"
+    "|---|---|---|---|---|\n"
+)
+_TABLE_ROW = "| {} | {} | {} | {} | {} |\n".format
+
+
+if msgspec is not None:
+
+    class _NasdaqRow(msgspec.Struct):
+        """The subset of a Nasdaq calendar row that ``EarningsEvent`` uses.
+
+        Values are left untyped so the view is exactly as lenient as the dict
+        path; ``EarningsEvent.from_view`` coerces them like ``from_api``.
+        """
+
+        symbol: Any = ""
+        companyName: Any = ""
+        epsForecast: Any = None
+        epsActual: Any = None
+        time: Any = None
+        timeZone: Any = None
 
+    class _NasdaqData(msgspec.Struct):
+        rows: Optional[List[_NasdaqRow]] = None
 
-@dataclass
+    class _NasdaqPayload(msgspec.Struct):
+        data: Optional[_NasdaqData] = None
+
+    # Fields missing from the views above are skipped while decoding rather
+    # than materialised into dictionaries.
+    _decode_payload = msgspec.json.Decoder(_NasdaqPayload).decode
+    _DECODE_ERRORS: tuple = (ValueError, msgspec.DecodeError)
+else:
+    _DECODE_ERRORS = (ValueError,)
+
+
+@dataclass(slots=True)
 class EarningsEvent:
     """Representation of a single earnings announcement."""
 
@@ -34,14 +82,25 @@ class EarningsEvent:
     @classmethod
     def from_api(cls, row: Dict[str, str], on_date: _dt.date) -> "EarningsEvent":
         return cls(
-            symbol=row.get("symbol", "").strip(),
-            company=row.get("companyName", "").strip(),
+            symbol=str(row.get("symbol") or "").strip(),
+            company=str(row.get("companyName") or "").strip(),
             date=on_date,
             eps_estimate=row.get("epsForecast"),
             eps_actual=row.get("epsActual"),
             time=row.get("time") or row.get("timeZone"),
         )
 
+    @classmethod
+    def from_view(cls, row: "_NasdaqRow", on_date: _dt.date) -> "EarningsEvent":
+        return cls(
+            symbol=str(row.symbol or "").strip(),
+            company=str(row.companyName or "").strip(),
+            date=on_date,
+            eps_estimate=row.epsForecast,
+            eps_actual=row.epsActual,
+            time=row.time or row.timeZone,
+        )
+
 
 class EarningsCalendarError(RuntimeError):
     """Raised when the Nasdaq API returns an unexpected response."""
@@ -55,33 +114,50 @@ def _coerce_date(value: Optional[_dt.date | str]) -> _dt.date:
     return _dt.datetime.strptime(value, DATE_FORMAT).date()
 
 
-def _fetch_for_date(on_date: _dt.date, session: requests.Session, timeout: int) -> List[EarningsEvent]:
-    params = {"date": on_date.strftime(DATE_FORMAT)}
-    response = session.get(BASE_URL, params=params, headers=HEADERS, timeout=timeout)
-    try:
-        response.raise_for_status()
-    except requests.HTTPError as exc:  # pragma: no cover - network dependent
-        raise EarningsCalendarError(str(exc)) from exc
+def _parse_events(content: bytes, on_date: _dt.date) -> Sequence[EarningsEvent]:
+    # Weekends and holidays have no rows; share the empty tuple for those days.
+    if msgspec is not None:
+        payload = _decode_payload(content)
+        rows = payload.data.rows if payload.data else None
+        if not rows:
+            return ()
+        return [EarningsEvent.from_view(row, on_date) for row in rows]
 
-    data = response.json()
+    data = loads_json(content)
     rows = (data or {}).get("data", {}).get("rows", [])
-    if rows is None:
-        rows = []
+    if not rows:
+        return ()
     events = [EarningsEvent.from_api(row, on_date) for row in rows]
     return events
 
 
+def _fetch_for_date(
+    on_date: _dt.date, session: requests.Session, timeout: int
+) -> Sequence[EarningsEvent]:
+    params = {"date": on_date.strftime(DATE_FORMAT)}
+    try:
+        content = conditional_get(
+            session, BASE_URL, params=params, headers=HEADERS, timeout=timeout
+        )
+        return _parse_events(content, on_date)
+    except requests.HTTPError as exc:  # pragma: no cover - network dependent
+        raise EarningsCalendarError(str(exc)) from exc
+    except _DECODE_ERRORS as exc:  # pragma: no cover - network dependent
+        raise EarningsCalendarError(f"Unexpected payload for {on_date}: {exc}") from exc
+
+
 def fetch_earnings(
     start: Optional[_dt.date | str] = None,
     end: Optional[_dt.date | str] = None,
     *,
     session: Optional[requests.Session] = None,
     timeout: int = 30,
-) -> Dict[_dt.date, List[EarningsEvent]]:
+) -> List[EarningsEvent]:
     """Fetch earnings events for a date range.
 
     If only ``start`` is supplied, ``end`` defaults to the same day.  When
     neither is provided the function returns the current day's earnings.
+    Events are returned as a single list ordered by date.
     """
 
     start_date = _coerce_date(start)
@@ -89,47 +165,53 @@ def fetch_earnings(
     if end_date < start_date:
         raise ValueError("end date must be after start date")
 
-    session = session or requests.Session()
-    current = start_date
-    events: Dict[_dt.date, List[EarningsEvent]] = {}
+    session = session or make_session()
+    dates = [
+        start_date + _dt.timedelta(days=offset)
+        for offset in range((end_date - start_date).days + 1)
+    ]
 
-    while current <= end_date:
-        events[current] = _fetch_for_date(current, session=session, timeout=timeout)
-        current += _dt.timedelta(days=1)
-
-    return events
+    # Each day is a separate request, so fetch them concurrently.  The shared
+    # session's connection pool is thread-safe and reuses keep-alive sockets.
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(dates))) as executor:
+        futures = [
+            executor.submit(_fetch_for_date, on_date, session=session, timeout=timeout)
+            for on_date in dates
+        ]
+        return list(itertools.chain.from_iterable(future.result() for future in futures))
 
 
-def fetch_week_ahead(**kwargs) -> Dict[_dt.date, List[EarningsEvent]]:
+def fetch_week_ahead(**kwargs) -> List[EarningsEvent]:
     start = kwargs.pop("start", _dt.date.today())
     end = kwargs.pop("end", start + _dt.timedelta(days=6))
     return fetch_earnings(start=start, end=end, **kwargs)
 
 
-def earnings_to_markdown(events: Dict[_dt.date, List[EarningsEvent]]) -> str:
-    """Render the collected earnings information to Markdown."""
+def earnings_to_markdown(events: Sequence[EarningsEvent]) -> str:
+    """Render the collected earnings information to Markdown, grouped by day."""
 
     if not events:
         return "No earnings events found.\n"
 
-    lines = []
-    for event_date in sorted(events):
-        lines.append(f"### {event_date.strftime('%A, %B %d, %Y')}")
-        day_events = events[event_date]
-        if not day_events:
-            lines.append("No scheduled earnings releases.\n")
-            continue
-        lines.append(
-            "| Symbol | Company | Time | EPS Estimate | EPS Actual |\n"
-            "|---|---|---|---|---|"
-        )
+    buffer = io.StringIO()
+    write = buffer.write
+    # ``sorted`` is stable, so events keep their API order within each day.
+    by_date = itertools.groupby(sorted(events, key=attrgetter("date")), key=attrgetter("date"))
+    for event_date, day_events in by_date:
+        write(f"### {event_date.strftime('%A, %B %d, %Y')}\n")
+        write(_TABLE_HEADER)
         for event in day_events:
-            lines.append(
-                f"| {event.symbol} | {event.company} | {event.time or ''} | "
-                f"{event.eps_estimate or ''} | {event.eps_actual or ''} |"
+            write(
+                _TABLE_ROW(
+                    event.symbol,
+                    event.company,
+                    event.time or "",
+                    event.eps_estimate or "",
+                    event.eps_actual or "",
+                )
             )
-        lines.append("")
-    return "\n".join(lines).strip() + "\n"
+        write("\n")
+    return buffer.getvalue().strip() + "\n"
 
 
 __all__ = [
@@ -13,71 +13,96 @@ Example
 >>> start = date.today()
 >>> end = start + timedelta(days=7)
 >>> events = fetch_economic_calendar(start, end, countries=["United States"])
->>> print(events[0]["Event"])
+>>> print(events[0].event)
 """
 
 from __future__ import annotations
 
+import io
 import os
+import re
+from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
+from types import MappingProxyType
 from typing import List, Mapping, Optional, Sequence
 
 import requests
 
+from HttpSession import conditional_get, loads_json, make_session
+
 BASE_URL = "https://api.tradingeconomics.com/calendar"
 DATE_FORMAT = "%Y-%m-%d"
 
 
-class EconomicEvent(Mapping[str, object]):
-    """Dictionary-like representation of a Trading Economics event.
-
-    The API already returns dictionaries, but this wrapper gives us type hints
-    and the flexibility to add helper properties without breaking backwards
-    compatibility.
-    """
+_UNSET = object()
+# The only shape the API uses for release times, optionally followed by "Z".
+_RELEASE_TIME_RE = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}")
 
-    def __init__(self, payload: Mapping[str, object]) -> None:
-        self._payload = dict(payload)
 
-    def __getitem__(self, key: str) -> object:
-        return self._payload[key]
+@dataclass(slots=True)
+class EconomicEvent:
+    """A single Trading Economics calendar event.
 
-    def __iter__(self):
-        return iter(self._payload)
+    The fields used for reporting are read out of the API payload once; the
+    payload itself is kept (without copying) for anything else via
+    :meth:`as_dict`.
+    """
 
-    def __len__(self) -> int:  # pragma: no cover - trivial
-        return len(self._payload)
+    country: Optional[str]
+    category: Optional[str]
+    event: Optional[str]
+    date_utc: Optional[str]
+    time: Optional[str]
+    actual: Optional[str]
+    forecast: Optional[str]
+    previous: Optional[str]
+    _raw: Mapping[str, object] = field(repr=False, compare=False)
+    _release_time: object = field(default=_UNSET, init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_payload(cls, payload: Mapping[str, object]) -> "EconomicEvent":
+        get = payload.get
+        return cls(
+            country=get("Country") or get("country"),
+            category=get("Category") or get("category"),
+            event=get("Event") or get("event"),
+            date_utc=get("DateUtc") or get("DateUTC") or get("Date"),
+            time=get("Time"),
+            actual=get("Actual"),
+            forecast=get("Forecast"),
+            previous=get("Previous"),
+            _raw=payload,
+        )
 
     @property
-    def country(self) -> Optional[str]:
-        return self._payload.get("Country") or self._payload.get("country")
+    def release_time(self) -> Optional[datetime]:
+        """Naive UTC release time, parsed once and then cached."""
 
-    @property
-    def category(self) -> Optional[str]:
-        return self._payload.get("Category") or self._payload.get("category")
+        if self._release_time is _UNSET:
+            self._release_time = self._parse_release_time()
+        return self._release_time
 
-    @property
-    def event(self) -> Optional[str]:
-        return self._payload.get("Event") or self._payload.get("event")
-
-    @property
-    def release_time(self) -> Optional[datetime]:
-        release = self._payload.get("DateUTC") or self._payload.get("date")
+    def _parse_release_time(self) -> Optional[datetime]:
+        release = self._raw.get("DateUTC") or self._raw.get("date")
         if not release:
             return None
         if isinstance(release, datetime):
             return release
-        for fmt in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M:%SZ"):
-            try:
-                return datetime.strptime(str(release), fmt)
-            except ValueError:
-                continue
-        return None
+        # ``fromisoformat`` is much cheaper than ``strptime`` but accepts far
+        # more (offsets, date-only and compact forms), so check the shape
+        # first.  Dropping the trailing "Z" keeps the result naive UTC.
+        text = str(release).removesuffix("Z")
+        if not _RELEASE_TIME_RE.fullmatch(text):
+            return None
+        try:
+            return datetime.fromisoformat(text)
+        except ValueError:
+            return None
 
     def as_dict(self) -> Mapping[str, object]:
-        """Return the raw dictionary."""
+        """Return a read-only view of the raw payload without copying it."""
 
-        return dict(self._payload)
+        return MappingProxyType(self._raw)
 
 
 class EconomicCalendarError(RuntimeError):
@@ -157,22 +182,18 @@ def fetch_economic_calendar(
     params = dict(_build_params(start, end, importance, countries, categories))
     params["c"] = _resolve_credentials(client, secret)
 
-    http = session or requests.Session()
-    response = http.get(BASE_URL, params=params, timeout=timeout)
+    http = session or make_session()
     try:
-        response.raise_for_status()
+        payload = loads_json(conditional_get(http, BASE_URL, params=params, timeout=timeout))
     except requests.HTTPError as exc:  # pragma: no cover - network dependent
         raise EconomicCalendarError(str(exc)) from exc
-
-    try:
-        payload = response.json()
     except ValueError as exc:  # pragma: no cover - network dependent
         raise EconomicCalendarError("Invalid JSON returned from API") from exc
 
     if not isinstance(payload, list):
         raise EconomicCalendarError("Unexpected payload structure")
 
-    return [EconomicEvent(event) for event in payload]
+    return [EconomicEvent.from_payload(event) for event in payload]
 
 
 def fetch_week_ahead(**kwargs) -> List[EconomicEvent]:
@@ -189,26 +210,26 @@ def events_to_markdown(events: Sequence[EconomicEvent]) -> str:
     if not events:
         return "No economic events found.\n"
 
-    header = "| Date | Time (UTC) | Country | Event | Actual | Forecast | Previous |"\
-        "\n|---|---|---|---|---|---|---|"
-    rows = []
+    buffer = io.StringIO()
+    write = buffer.write
+    write(
+        "| Date | Time (UTC) | Country | Event | Actual | Forecast | Previous |\n"
+        "|---|---|---|---|---|---|---|\n"
+    )
+    row = "| {} | {} | {} | {} | {} | {} | {} |\n".format
     for event in events:
-        data = event.as_dict()
-        when = data.get("DateUtc") or data.get("DateUTC") or data.get("Date")
-        time = data.get("Time") or ""
-        rows.append(
-            "| {date} | {time} | {country} | {event} | {actual} | {forecast} |"
-            " {previous} |".format(
-                date=when or "",
-                time=time,
-                country=data.get("Country", ""),
-                event=data.get("Event", ""),
-                actual=data.get("Actual", ""),
-                forecast=data.get("Forecast", ""),
-                previous=data.get("Previous", ""),
+        write(
+            row(
+                event.date_utc or "",
+                event.time or "",
+                event.country or "",
+                event.event or "",
+                event.actual or "",
+                event.forecast or "",
+                event.previous or "",
             )
         )
-    return "\n".join([header, *rows]) + "\n"
+    return buffer.getvalue()
 
 
 __all__ = [
@@ -0,0 +1,173 @@
+"""Shared HTTP session configuration for the scrapers."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shelve
+import threading
+import time
+from pathlib import Path
+from typing import Mapping, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+CACHE_DIR = Path(
+    os.getenv("MARKETSCRAPER_CACHE_DIR", Path.home() / ".cache" / "marketscraper")
+)
+HTTP_CACHE = CACHE_DIR / "http_cache"
+POOL_SIZE = 16
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+CACHE_MAX_AGE = 7 * 24 * 60 * 60
+CACHE_MAX_ENTRIES = 256
+CACHE_VERSION = 2
+_VERSION_KEY = "__version__"
+_INDEX_KEY = "__index__"
+
+# ``shelve`` does not support concurrent access, and the scrapers fetch from
+# worker threads.
+_cache_lock = threading.Lock()
+
+
+def make_session() -> requests.Session:
+    """Return a ``requests.Session`` with a pooled, retrying adapter.
+
+    A single session can be shared by every scraper (including their worker
+    threads) so keep-alive connections are reused instead of paying for a new
+    TCP/TLS handshake on each request.  Retries back off on throttling and
+    transient server errors; once they are exhausted the final response is
+    returned so the callers' own status handling still applies.
+    """
+
+    retries = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=RETRY_STATUSES,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=retries)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def loads_json(data: bytes) -> object:
+    """Decode a JSON document.
+
+    Uses ``orjson`` when it is installed, which parses several times faster
+    than the standard library, and falls back to :mod:`json` otherwise.  Both
+    raise a ``ValueError`` subclass on malformed input.
+    """
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def decode_json(response: requests.Response) -> object:
+    """Decode a JSON response body with :func:`loads_json`."""
+
+    return loads_json(response.content)
+
+
+def _open_cache() -> shelve.Shelf:
+    cache = shelve.open(str(HTTP_CACHE))
+    if cache.get(_VERSION_KEY) != CACHE_VERSION:
+        # Unknown layout (e.g. written by an older release): start afresh.
+        cache.close()
+        cache = shelve.open(str(HTTP_CACHE), flag="n")
+        cache[_VERSION_KEY] = CACHE_VERSION
+        cache[_INDEX_KEY] = {}
+    return cache
+
+
+def _read_cache(key: str) -> Optional[tuple]:
+    with _cache_lock:
+        try:
+            with _open_cache() as cache:
+                entry = cache.get(key)
+        except Exception:  # pragma: no cover - unreadable cache
+            return None
+    if entry is None or time.time() - entry[3] > CACHE_MAX_AGE:
+        return None
+    return entry
+
+
+def _write_cache(key: str, entry: tuple) -> None:
+    with _cache_lock:
+        try:
+            HTTP_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            with _open_cache() as cache:
+                cache[key] = entry
+                # The index maps keys to write times so expired and surplus
+                # entries can be dropped without loading every body.
+                index = cache.get(_INDEX_KEY, {})
+                index[key] = entry[3]
+                by_age = sorted(index, key=index.get)
+                excess = max(0, len(by_age) - CACHE_MAX_ENTRIES)
+                for stale in by_age:
+                    if excess <= 0 and entry[3] - index[stale] <= CACHE_MAX_AGE:
+                        break
+                    del cache[stale]
+                    del index[stale]
+                    excess -= 1
+                cache[_INDEX_KEY] = index
+        except Exception:  # pragma: no cover - the cache is best effort
+            pass
+
+
+def conditional_get(
+    session: requests.Session,
+    url: str,
+    *,
+    params: Optional[Mapping[str, str]] = None,
+    headers: Optional[Mapping[str, str]] = None,
+    timeout: int = 30,
+) -> bytes:
+    """GET ``url`` and return the response body, revalidating cached copies.
+
+    The raw body is stored alongside the server's ``ETag`` and
+    ``Last-Modified`` headers.  Subsequent requests send ``If-None-Match`` /
+    ``If-Modified-Since``, and a ``304 Not Modified`` reply returns the cached
+    body without downloading it again.  Callers parse the body on every call,
+    so cached entries never depend on the parsing code.  Entries expire after
+    ``CACHE_MAX_AGE`` seconds and at most ``CACHE_MAX_ENTRIES`` are kept.
+    Error responses raise ``requests.HTTPError``.
+    """
+
+    prepared_url = requests.Request("GET", url, params=params).prepare().url
+    # Hash the URL so query-string credentials are never written to disk.
+    key = hashlib.sha256(prepared_url.encode("utf-8")).hexdigest()
+    entry = _read_cache(key)
+
+    request_headers = dict(headers or {})
+    if entry is not None:
+        etag, last_modified, _, _ = entry
+        if etag:
+            request_headers["If-None-Match"] = etag
+        if last_modified:
+            request_headers["If-Modified-Since"] = last_modified
+
+    response = session.get(url, params=params, headers=request_headers, timeout=timeout)
+    if response.status_code == 304 and entry is not None:
+        return entry[2]
+    response.raise_for_status()
+
+    body = response.content
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        _write_cache(key, (etag, last_modified, body, time.time()))
+    return body
+
+
+__all__ = ["CACHE_DIR", "conditional_get", "decode_json", "loads_json", "make_session"]
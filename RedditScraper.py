@@ -3,23 +3,71 @@
 from __future__ import annotations
 
 import datetime as _dt
-from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional
+import functools
+import io
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
 
 import requests
 
+from HttpSession import decode_json, make_session
+
+try:  # pragma: no cover - optional dependency
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
 BASE_URL = "https://www.reddit.com"
 HEADERS = {"User-Agent": "MarketScraperBot/0.1"}
+MAX_WORKERS = 8
+# Reddit serves at most 100 posts per listing page; asking for more only
+# returns the same page.
+MAX_LISTING_LIMIT = 100
+
+
+if msgspec is not None:
+
+    class _RedditInfo(msgspec.Struct):
+        """The subset of a listing child's ``data`` that ``RedditPost`` uses.
+
+        Values are left untyped so the view is exactly as lenient as the dict
+        path; ``RedditPost.from_view`` coerces them like ``from_listing``.
+        """
+
+        id: Any = ""
+        title: Any = ""
+        author: Any = ""
+        permalink: Any = ""
+        created_utc: Any = 0
+        url: Any = ""
+
+    class _RedditChild(msgspec.Struct):
+        data: Optional[_RedditInfo] = None
+
+    class _RedditListing(msgspec.Struct):
+        children: Optional[List[_RedditChild]] = None
 
+    class _RedditPayload(msgspec.Struct):
+        data: Optional[_RedditListing] = None
 
+    # Posts carry dozens of metadata keys; only the fields declared above are
+    # decoded, the rest are skipped.
+    _decode_payload = msgspec.json.Decoder(_RedditPayload).decode
+    _DECODE_ERRORS: tuple = (ValueError, msgspec.DecodeError)
+else:
+    _DECODE_ERRORS = (ValueError,)
+
+
+@functools.lru_cache(maxsize=4096)
 def _parse_timestamp(timestamp: Optional[float]) -> str:
     if not timestamp:
         return ""
-    dt = _dt.datetime.utcfromtimestamp(timestamp)
+    dt = _dt.datetime.fromtimestamp(timestamp, tz=_dt.timezone.utc)
     return dt.strftime("%Y-%m-%d %H:%M UTC")
 
 
-@dataclass
+@dataclass(slots=True)
 class RedditPost:
     id: str
     title: str
@@ -27,6 +75,11 @@ class RedditPost:
     permalink: str
     created_utc: Optional[float]
     url: str
+    created_at: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        # Format the timestamp once rather than on every access.
+        self.created_at = _parse_timestamp(self.created_utc)
 
     @classmethod
     def from_listing(cls, data: Dict[str, object]) -> "RedditPost":
@@ -38,12 +91,20 @@ class RedditPost:
             author=str(info.get("author", "")),
             permalink=permalink,
             created_utc=float(info.get("created_utc", 0) or 0),
-            url=f"{BASE_URL}{permalink}" if permalink else str(info.get("url", "")),
+            url=BASE_URL + permalink if permalink else str(info.get("url", "")),
         )
 
-    @property
-    def created_at(self) -> str:
-        return _parse_timestamp(self.created_utc)
+    @classmethod
+    def from_view(cls, info: "_RedditInfo") -> "RedditPost":
+        permalink = info.permalink
+        return cls(
+            id=str(info.id),
+            title=str(info.title),
+            author=str(info.author),
+            permalink=permalink,
+            created_utc=float(info.created_utc or 0),
+            url=BASE_URL + permalink if permalink else str(info.url),
+        )
 
 
 class RedditScraperError(RuntimeError):
@@ -51,10 +112,20 @@ class RedditScraperError(RuntimeError):
 
 
 def _fetch_listing(path: str, *, limit: int, session: requests.Session) -> List[RedditPost]:
-    response = session.get(f"{BASE_URL}{path}", params={"limit": limit}, headers=HEADERS, timeout=30)
+    params = {"limit": min(limit, MAX_LISTING_LIMIT)}
+    response = session.get(BASE_URL + path, params=params, headers=HEADERS, timeout=30)
     if response.status_code >= 400:
         raise RedditScraperError(f"Error fetching {path}: {response.status_code}")
-    payload = response.json()
+    try:
+        if msgspec is not None:
+            payload = _decode_payload(response.content)
+            children = payload.data.children if payload.data else None
+            return [
+                RedditPost.from_view(child.data or _RedditInfo()) for child in children or ()
+            ]
+        payload = decode_json(response)
+    except _DECODE_ERRORS as exc:  # pragma: no cover - network dependent
+        raise RedditScraperError(f"Unexpected payload for {path}: {exc}") from exc
     children = (payload or {}).get("data", {}).get("children", [])
     return [RedditPost.from_listing(child) for child in children]
 
@@ -68,20 +139,28 @@ def fetch_reddit_updates(
 ) -> Dict[str, List[RedditPost]]:
     """Fetch the newest posts for the specified subreddits and users."""
 
-    session = session or requests.Session()
-    results: Dict[str, List[RedditPost]] = {}
+    session = session or make_session()
 
+    tasks: List[tuple[str, str]] = []
     for subreddit in subreddits:
-        name = subreddit.lstrip('r/').strip()
-        key = f"r/{name}"
-        path = f"/r/{name}/new.json"
-        results[key] = _fetch_listing(path, limit=limit, session=session)
+        name = subreddit.removeprefix("r/").strip()
+        tasks.append((f"r/{name}", f"/r/{name}/new.json"))
 
     for user in users:
-        username = user.lstrip("u/").strip()
-        key = f"u/{username}"
-        path = f"/user/{username}/submitted.json"
-        results[key] = _fetch_listing(path, limit=limit, session=session)
+        username = user.removeprefix("u/").strip()
+        tasks.append((f"u/{username}", f"/user/{username}/submitted.json"))
+
+    if not tasks:
+        return {}
+
+    # Listings are independent, so fetch them concurrently and then collect
+    # the results in the original subreddit/user order.
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(tasks))) as executor:
+        futures = [
+            (key, executor.submit(_fetch_listing, path, limit=limit, session=session))
+            for key, path in tasks
+        ]
+        results: Dict[str, List[RedditPost]] = {key: future.result() for key, future in futures}
 
     return results
 
@@ -90,19 +169,17 @@ def reddit_to_markdown(posts: Dict[str, List[RedditPost]]) -> str:
     if not posts:
         return "No Reddit activity found.\n"
 
-    lines: List[str] = []
+    buffer = io.StringIO()
+    write = buffer.write
     for source, entries in posts.items():
-        lines.append(f"### {source}")
+        write(f"### {source}\n")
         if not entries:
-            lines.append("No new posts.\n")
+            write("No new posts.\n\n")
             continue
         for post in entries:
-            lines.append(
-                f"- [{post.created_at}]({post.url}) {post.title}"
-                f" by u/{post.author}"
-            )
-        lines.append("")
-    return "\n".join(lines).strip() + "\n"
+            write(f"- [{post.created_at}]({post.url}) {post.title} by u/{post.author}\n")
+        write("\n")
+    return buffer.getvalue().strip() + "\n"
 
 
 __all__ = ["RedditPost", "RedditScraperError", "fetch_reddit_updates", "reddit_to_markdown"]
@@ -4,12 +4,16 @@ from __future__ import annotations
 
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional
 
+import requests
+
 from EconScraper import EconomicEvent, events_to_markdown, fetch_economic_calendar
 from EarningsScraper import EarningsEvent, earnings_to_markdown, fetch_earnings
+from HttpSession import make_session
 from RedditScraper import RedditPost, fetch_reddit_updates, reddit_to_markdown
 from TwitterScraper import Tweet, fetch_recent_tweets, tweets_to_markdown
 
@@ -19,14 +23,18 @@ def _daterange(start: date, lookahead: int) -> tuple[date, date]:
     return start, end
 
 
-def collect_economic_data(start: date, lookahead: int) -> List[EconomicEvent]:
+def collect_economic_data(
+    start: date, lookahead: int, *, session: Optional[requests.Session] = None
+) -> List[EconomicEvent]:
     start_date, end_date = _daterange(start, lookahead)
-    return fetch_economic_calendar(start=start_date, end=end_date)
+    return fetch_economic_calendar(start=start_date, end=end_date, session=session)
 
 
-def collect_earnings_data(start: date, lookahead: int) -> Dict[date, List[EarningsEvent]]:
+def collect_earnings_data(
+    start: date, lookahead: int, *, session: Optional[requests.Session] = None
+) -> List[EarningsEvent]:
     start_date, end_date = _daterange(start, lookahead)
-    return fetch_earnings(start=start_date, end=end_date)
+    return fetch_earnings(start=start_date, end=end_date, session=session)
 
 
 def collect_twitter_data(handles: Iterable[str], **kwargs) -> Dict[str, List[Tweet]]:
@@ -37,42 +45,47 @@ def collect_twitter_data(handles: Iterable[str], **kwargs) -> Dict[str, List[Twe
 
 
 def collect_reddit_data(
-    *, subreddits: Iterable[str], users: Iterable[str], limit: int
+    *,
+    subreddits: Iterable[str],
+    users: Iterable[str],
+    limit: int,
+    session: Optional[requests.Session] = None,
 ) -> Dict[str, List[RedditPost]]:
-    return fetch_reddit_updates(subreddits=subreddits, users=users, limit=limit)
+    return fetch_reddit_updates(subreddits=subreddits, users=users, limit=limit, session=session)
 
 
 def build_markdown_report(
     *,
     generated_at: datetime,
     economic_events: Optional[List[EconomicEvent]] = None,
-    earnings_events: Optional[Dict[date, List[EarningsEvent]]] = None,
+    earnings_events: Optional[List[EarningsEvent]] = None,
     twitter_posts: Optional[Dict[str, List[Tweet]]] = None,
     reddit_posts: Optional[Dict[str, List[RedditPost]]] = None,
 ) -> str:
-    lines = [
-        "# Market Intelligence Report",
-        f"_Generated on {generated_at.strftime('%Y-%m-%d %H:%M %Z')}_",
-        "",
-    ]
+    """Assemble the report, leaving out sources that produced no data."""
+
+    def _sections() -> Iterable[str]:
+        yield "# Market Intelligence Report"
+        yield f"_Generated on {generated_at.strftime('%Y-%m-%d %H:%M %Z')}_"
+        yield ""
 
-    if economic_events is not None:
-        lines.append("## Economic Calendar")
-        lines.append(events_to_markdown(economic_events))
+        if economic_events:
+            yield "## Economic Calendar"
+            yield events_to_markdown(economic_events)
 
-    if earnings_events is not None:
-        lines.append("## Earnings Calendar")
-        lines.append(earnings_to_markdown(earnings_events))
+        if earnings_events:
+            yield "## Earnings Calendar"
+            yield earnings_to_markdown(earnings_events)
 
-    if twitter_posts is not None:
-        lines.append("## Twitter Highlights")
-        lines.append(tweets_to_markdown(twitter_posts))
+        if twitter_posts:
+            yield "## Twitter Highlights"
+            yield tweets_to_markdown(twitter_posts)
 
-    if reddit_posts is not None:
-        lines.append("## Reddit Highlights")
-        lines.append(reddit_to_markdown(reddit_posts))
+        if reddit_posts:
+            yield "## Reddit Highlights"
+            yield reddit_to_markdown(reddit_posts)
 
-    return "\n".join(lines).strip() + "\n"
+    return "\n".join(_sections()).strip() + "\n"
 
 
 def parse_handles(value: Optional[str]) -> List[str]:
@@ -110,43 +123,41 @@ def main(argv: Optional[List[str]] = None) -> int:
     start_date: date = args.start
     lookahead: int = args.lookahead
 
-    economic_events = None
-    earnings_events = None
-    twitter_posts = None
-    reddit_posts = None
-
-    try:
-        if not args.skip_economic:
-            economic_events = collect_economic_data(start_date, lookahead)
-    except Exception as exc:  # pragma: no cover - network dependent
-        economic_events = []
-        print(f"Failed to fetch economic data: {exc}", file=sys.stderr)
-
-    try:
-        if not args.skip_earnings:
-            earnings_events = collect_earnings_data(start_date, lookahead)
-    except Exception as exc:  # pragma: no cover - network dependent
-        earnings_events = {}
-        print(f"Failed to fetch earnings data: {exc}", file=sys.stderr)
-
     twitter_handles = parse_handles(args.twitter)
-    try:
-        if not args.skip_twitter and twitter_handles:
-            twitter_posts = collect_twitter_data(twitter_handles)
-    except Exception as exc:  # pragma: no cover - network dependent
-        twitter_posts = {}
-        print(f"Failed to fetch twitter data: {exc}", file=sys.stderr)
-
     reddit_subs = parse_handles(args.reddit_subreddits)
     reddit_users = parse_handles(args.reddit_users)
-    try:
-        if not args.skip_reddit and (reddit_subs or reddit_users):
-            reddit_posts = collect_reddit_data(
-                subreddits=reddit_subs, users=reddit_users, limit=args.reddit_limit
-            )
-    except Exception as exc:  # pragma: no cover - network dependent
-        reddit_posts = {}
-        print(f"Failed to fetch reddit data: {exc}", file=sys.stderr)
+    session = make_session()
+
+    # The collectors are independent and network bound, so run them side by
+    # side.  A source that fails is reported on stderr and left out.
+    jobs = {}
+    if not args.skip_economic:
+        jobs["economic"] = lambda: collect_economic_data(start_date, lookahead, session=session)
+    if not args.skip_earnings:
+        jobs["earnings"] = lambda: collect_earnings_data(start_date, lookahead, session=session)
+    if not args.skip_twitter and twitter_handles:
+        jobs["twitter"] = lambda: collect_twitter_data(twitter_handles, session=session)
+    if not args.skip_reddit and (reddit_subs or reddit_users):
+        jobs["reddit"] = lambda: collect_reddit_data(
+            subreddits=reddit_subs,
+            users=reddit_users,
+            limit=args.reddit_limit,
+            session=session,
+        )
+
+    results = {}
+    with session, ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {name: executor.submit(job) for name, job in jobs.items()}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as exc:  # pragma: no cover - network dependent
+                print(f"Failed to fetch {name} data: {exc}", file=sys.stderr)
+
+    economic_events = results.get("economic")
+    earnings_events = results.get("earnings")
+    twitter_posts = results.get("twitter")
+    reddit_posts = results.get("reddit")
 
     report = build_markdown_report(
         generated_at=datetime.now(timezone.utc),
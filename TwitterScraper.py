@@ -2,14 +2,24 @@
 
 from __future__ import annotations
 
+import io
+import json
 import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from typing import Dict, Iterable, List, Optional
 
 import requests
 
+from HttpSession import CACHE_DIR, decode_json, make_session
+
 USER_LOOKUP_URL = "https://api.twitter.com/2/users/by"
 USER_TIMELINE_URL = "https://api.twitter.com/2/users/{user_id}/tweets"
+_TIMELINE_URL_FMT = USER_TIMELINE_URL.format
+_TWEET_URL_FMT = "https://twitter.com/{}/status/{}".format
+MAX_WORKERS = 8
+USER_ID_CACHE = CACHE_DIR / "twitter_ids.json"
 
 
 def _default_bearer_token(provided: Optional[str]) -> str:
@@ -23,7 +33,7 @@ def _default_bearer_token(provided: Optional[str]) -> str:
     return token
 
 
-@dataclass
+@dataclass(slots=True)
 class Tweet:
     id: str
     author_id: str
@@ -41,7 +51,7 @@ class Tweet:
             author_id=author_id,
             text=payload.get("text", ""),
             created_at=created_at,
-            url=f"https://twitter.com/{author_id}/status/{tweet_id}" if tweet_id else "",
+            url=_TWEET_URL_FMT(author_id, tweet_id) if tweet_id else "",
         )
 
 
@@ -49,8 +59,39 @@ class TwitterScraperError(RuntimeError):
     """Raised when the Twitter API returns an error response."""
 
 
+def _load_user_id_cache() -> Dict[str, str]:
+    try:
+        with USER_ID_CACHE.open(encoding="utf-8") as handle:
+            data = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _save_user_id_cache(cache: Dict[str, str]) -> None:
+    """Atomically persist the username -> id mapping; failures are ignored."""
+
+    try:
+        USER_ID_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=USER_ID_CACHE.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(cache, handle)
+            os.replace(tmp_path, USER_ID_CACHE)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+    except OSError:  # pragma: no cover - the cache is best effort
+        pass
+
+
+# Username -> user id mappings practically never change, so they are kept
+# across runs and only unseen handles are sent to the lookup endpoint.
+_user_ids: Dict[str, str] = _load_user_id_cache()
+
+
 def _lookup_user_ids(handles: Iterable[str], session: requests.Session, headers: Dict[str, str]) -> Dict[str, str]:
-    usernames = ",".join([handle.lstrip("@") for handle in handles])
+    usernames = ",".join([handle.removeprefix("@") for handle in handles])
     if not usernames:
         return {}
     response = session.get(
@@ -59,7 +100,7 @@ def _lookup_user_ids(handles: Iterable[str], session: requests.Session, headers:
         headers=headers,
         timeout=30,
     )
-    data = response.json()
+    data = decode_json(response)
     if "errors" in data:
         raise TwitterScraperError(str(data["errors"]))
     return {entry["username"].lower(): entry["id"] for entry in data.get("data", [])}
@@ -93,35 +134,48 @@ def fetch_recent_tweets(
 
     token = _default_bearer_token(bearer_token)
     headers = {"Authorization": f"Bearer {token}"}
-    session = session or requests.Session()
+    session = session or make_session()
 
-    handles = list(handles)
-    id_mapping = _lookup_user_ids(handles, session=session, headers=headers)
-
-    tweets: Dict[str, List[Tweet]] = {handle: [] for handle in handles}
+    # Normalise once: (original handle, username without "@", lookup key).
+    normalized = []
     for handle in handles:
-        username = handle.lstrip("@")
-        user_id = id_mapping.get(username.lower())
-        if not user_id:
-            continue
-        params = {
-            "max_results": max(5, min(max_results, 100)),
-            "tweet.fields": "created_at,author_id",
-        }
-        if start_time:
-            params["start_time"] = start_time
-        if end_time:
-            params["end_time"] = end_time
+        username = handle.removeprefix("@")
+        normalized.append((handle, username, username.lower()))
+    missing = [username for _, username, key in normalized if key not in _user_ids]
+    if missing:
+        _user_ids.update(_lookup_user_ids(missing, session=session, headers=headers))
+        _save_user_id_cache(_user_ids)
+
+    params = {
+        "max_results": max(5, min(max_results, 100)),
+        "tweet.fields": "created_at,author_id",
+    }
+    if start_time:
+        params["start_time"] = start_time
+    if end_time:
+        params["end_time"] = end_time
+
+    tweets: Dict[str, List[Tweet]] = {handle: [] for handle, _, _ in normalized}
+    jobs = [(handle, _user_ids[key]) for handle, _, key in normalized if _user_ids.get(key)]
+    if not jobs:
+        return tweets
+
+    def _fetch_one(handle: str, user_id: str) -> tuple[str, Dict[str, object]]:
         response = session.get(
-            USER_TIMELINE_URL.format(user_id=user_id),
+            _TIMELINE_URL_FMT(user_id=user_id),
             params=params,
             headers=headers,
             timeout=30,
         )
-        data = response.json()
-        if "errors" in data:
-            raise TwitterScraperError(str(data["errors"]))
-        tweets[handle] = [Tweet.from_api(tweet) for tweet in data.get("data", [])]
+        return handle, decode_json(response)
+
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(jobs))) as executor:
+        futures = [executor.submit(_fetch_one, handle, user_id) for handle, user_id in jobs]
+        for future in as_completed(futures):
+            handle, data = future.result()
+            if "errors" in data:
+                raise TwitterScraperError(str(data["errors"]))
+            tweets[handle] = [Tweet.from_api(tweet) for tweet in data.get("data", [])]
     return tweets
 
 
@@ -129,17 +183,18 @@ def tweets_to_markdown(tweets: Dict[str, List[Tweet]]) -> str:
     if not tweets:
         return "No tweets collected.\n"
 
-    lines = []
+    buffer = io.StringIO()
+    write = buffer.write
     for handle, items in tweets.items():
-        lines.append(f"### @{handle.lstrip('@')}")
+        write(f"### @{handle.removeprefix('@')}\n")
         if not items:
-            lines.append("No recent tweets found.\n")
+            write("No recent tweets found.\n\n")
             continue
         for tweet in items:
             timestamp = tweet.created_at or ""
-            lines.append(f"- [{timestamp}]({tweet.url}) {tweet.text.strip()}")
-        lines.append("")
-    return "\n".join(lines).strip() + "\n"
+            write(f"- [{timestamp}]({tweet.url}) {tweet.text.strip()}\n")
+        write("\n")
+    return buffer.getvalue().strip() + "\n"
 
 
 __all__ = ["Tweet", "TwitterScraperError", "fetch_recent_tweets", "tweets_to_markdown"]